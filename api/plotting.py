@@ -100,8 +100,13 @@ def render_histogram(hist_data: "HistogramData") -> str:
     fig, ax = plt.subplots(figsize=(8, 5))
     _setup_dark_theme(ax, fig)
 
-    ax.hist(hist_data.values, bins=hist_data.bins,
-            color=DARK_THEME['line_color'], edgecolor=DARK_THEME['bg_color'], alpha=0.8)
+    if hist_data.counts:
+        # Already binned by the Histogram op: draw one weighted sample per bin
+        ax.hist(hist_data.edges[:-1], bins=hist_data.edges, weights=hist_data.counts,
+                color=DARK_THEME['line_color'], edgecolor=DARK_THEME['bg_color'], alpha=0.8)
+    else:
+        ax.hist(hist_data.values, bins=hist_data.bins,
+                color=DARK_THEME['line_color'], edgecolor=DARK_THEME['bg_color'], alpha=0.8)
 
     if hist_data.title:
         ax.set_title(hist_data.title)
@@ -0,0 +1,125 @@
+"""Compile numeric lambda bodies to plain Python closures.
+
+Sampling a lambda at many points (plotting) through evaluate_expression pays for
+a child session, Scalar boxing and AST dispatch on every point. For bodies built
+from numbers, parameters, operators and plain operation calls, compile_lambda
+walks the AST once and returns a closure over raw Python values instead.
+
+The closure is an optimisation only: callers must treat any exception it raises
+as "evaluate this point the normal way", which keeps results and error behaviour
+identical to the interpreter.
+"""
+
+from typing import Any, Callable
+
+from mathlang.lang import ast
+from mathlang.types.scalar import Scalar
+from mathlang.types.callable import Lambda
+from mathlang.types.coercion import coerce_numeric
+from mathlang.engine.session import Session
+from mathlang.engine.evaluator import BINARY_OPS
+from mathlang.operations.registry import get_operation
+
+# A compiled node takes the tuple of raw parameter values and returns a raw value
+_Node = Callable[[tuple], Any]
+
+# ConstantsProvider's fixed values; only these are folded at compile time
+_PURE_CONSTANT_CATEGORY = "Constants/"
+
+
+class _NotCompilable(Exception):
+    """Raised while compiling when a node has no raw-value equivalent."""
+
+
+def compile_lambda(lam: Lambda, session: Session) -> Callable[..., Any] | None:
+    """
+    Compile a lambda to a closure over raw values, or return None if unsupported.
+
+    Free identifiers are resolved against session once, at compile time.
+    """
+    try:
+        body = _compile(lam.body, {name: i for i, name in enumerate(lam.parameters)}, session)
+    except _NotCompilable:
+        return None
+
+    def compiled(*args: Any) -> Any:
+        return body(args)
+
+    return compiled
+
+
+def _unwrap(result: Any) -> Any:
+    # Anything but a Scalar (List, Vector, ...) has no raw form; the caller falls
+    # back to the interpreter for this point
+    if not isinstance(result, Scalar):
+        raise _NotCompilable(result.type_name)
+    return result.value
+
+
+def _compile(expr: ast.Expression, params: dict[str, int], session: Session) -> _Node:
+    if isinstance(expr, (ast.NumberLiteral, ast.StringLiteral)):
+        value = expr.value
+        return lambda args: value
+
+    if isinstance(expr, ast.Identifier):
+        if expr.name in params:
+            index = params[expr.name]
+            return lambda args: args[index]
+        bound = session.get(expr.name)
+        if not isinstance(bound, Scalar):
+            raise _NotCompilable(expr.name)
+        value = bound.value
+        return lambda args: value
+
+    if isinstance(expr, ast.NamedConstant):
+        operation = get_operation(expr.name)
+        if operation is None:
+            raise _NotCompilable(expr.name)
+        execute = operation.execute
+        if not operation.category.startswith(_PURE_CONSTANT_CATEGORY):
+            # Any other zero-argument operation ([[Random]], [[Now]]) may differ
+            # per call, so run it on every evaluation like the interpreter does
+            return lambda args: _unwrap(execute([], session))
+        try:
+            value = _unwrap(execute([], session))
+        except Exception:
+            raise _NotCompilable(expr.name)
+        return lambda args: value
+
+    if isinstance(expr, ast.UnaryOp) and expr.operator == "-":
+        operand = _compile(expr.operand, params, session)
+        return lambda args: -operand(args)
+
+    if isinstance(expr, ast.BinaryOp):
+        op_func = BINARY_OPS.get(expr.operator)
+        if op_func is None:
+            raise _NotCompilable(expr.operator)
+        left = _compile(expr.left, params, session)
+        right = _compile(expr.right, params, session)
+
+        def binary(args: tuple) -> Any:
+            return op_func(*coerce_numeric(left(args), right(args)))
+
+        return binary
+
+    if isinstance(expr, ast.FunctionCall):
+        # Calls to user lambdas need their own scope; leave those to the interpreter
+        if isinstance(session.get(expr.name), Lambda) or expr.name in params:
+            raise _NotCompilable(expr.name)
+        operation = get_operation(expr.name)
+        if operation is None:
+            raise _NotCompilable(expr.name)
+        lazy = operation.lazy_arg_indices
+        arg_nodes = []
+        for i, arg in enumerate(expr.arguments):
+            if isinstance(arg, ast.LambdaExpr) or i in lazy:
+                raise _NotCompilable(expr.name)
+            arg_nodes.append(_compile(arg, params, session))
+        execute = operation.execute
+
+        def call(args: tuple) -> Any:
+            return _unwrap(execute([Scalar(node(args)) for node in arg_nodes], session))
+
+        return call
+
+    raise _NotCompilable(type(expr).__name__)
@@ -1,6 +1,7 @@
 """AST evaluator - transforms AST nodes into values."""
 
-from typing import Sequence
+import operator as _operator
+from typing import Any, Callable, Sequence
 
 from mathlang.lang import ast
 from mathlang.lang.parser import parse
@@ -18,6 +19,26 @@ from mathlang.engine.errors import (
 from mathlang.operations.registry import get_operation
 
 
+# Built-in scalar operators, looked up once per evaluation instead of an if/elif chain.
+# Public so the lambda compiler applies exactly the same operator semantics.
+BINARY_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "+": _operator.add,
+    "-": _operator.sub,
+    "*": _operator.mul,
+    "/": _operator.truediv,
+    "%": _operator.mod,
+    "^": _operator.pow,
+    ">": _operator.gt,
+    ">=": _operator.ge,
+    "<": _operator.lt,
+    "<=": _operator.le,
+    "==": _operator.eq,
+    "!=": _operator.ne,
+}
+
+_ZERO_CHECKED_OPS = frozenset({"/", "%"})
+
+
 class EvaluationResult:
     """Result of evaluating a statement."""
 
@@ -53,9 +74,14 @@ def evaluate(source: str, session: Session | None = None) -> list[EvaluationResu
 def evaluate_program(program: ast.Program, session: Session) -> list[EvaluationResult]:
     """Evaluate a parsed program."""
     results = []
-    for statement in program.statements:
-        result = evaluate_statement(statement, session)
-        results.append(result)
+    pinned = session.pin_clock()
+    try:
+        for statement in program.statements:
+            result = evaluate_statement(statement, session)
+            results.append(result)
+    finally:
+        if pinned:
+            session.unpin_clock()
     return results
 
 
@@ -132,36 +158,12 @@ def evaluate_binary(operator: str, left: MathObject, right: MathObject) -> MathO
     """Evaluate a binary operation."""
     # Try built-in operators first
     if isinstance(left, Scalar) and isinstance(right, Scalar):
-        left_val, right_val = coerce_numeric(left, right)
-
-        if operator == "+":
-            return Scalar(left_val + right_val)
-        elif operator == "-":
-            return Scalar(left_val - right_val)
-        elif operator == "*":
-            return Scalar(left_val * right_val)
-        elif operator == "/":
-            if right_val == 0:
-                raise DivisionByZeroError()
-            return Scalar(left_val / right_val)
-        elif operator == "%":
-            if right_val == 0:
+        op_func = BINARY_OPS.get(operator)
+        if op_func is not None:
+            left_val, right_val = coerce_numeric(left, right)
+            if operator in _ZERO_CHECKED_OPS and right_val == 0:
                 raise DivisionByZeroError()
-            return Scalar(left_val % right_val)
-        elif operator == "^":
-            return Scalar(left_val ** right_val)
-        elif operator == ">":
-            return Scalar(left_val > right_val)
-        elif operator == ">=":
-            return Scalar(left_val >= right_val)
-        elif operator == "<":
-            return Scalar(left_val < right_val)
-        elif operator == "<=":
-            return Scalar(left_val <= right_val)
-        elif operator == "==":
-            return Scalar(left_val == right_val)
-        elif operator == "!=":
-            return Scalar(left_val != right_val)
+            return Scalar(op_func(left_val, right_val))
 
     # Fall back to operation registry for custom operators
     operation = get_operation(operator)
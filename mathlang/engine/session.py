@@ -1,5 +1,6 @@
 """Evaluation session with variable scope."""
 
+import time
 from typing import Any
 
 from mathlang.types.base import MathObject
@@ -16,6 +17,8 @@ class Session:
     def __init__(self, parent: "Session | None" = None):
         self._variables: dict[str, MathObject] = {}
         self._parent = parent
+        # While an evaluation is running: [] until the clock is first read, then [timestamp]
+        self._clock_pin: list[float] | None = None
 
     def get(self, name: str) -> MathObject | None:
         """Get a variable value, checking parent scopes if not found locally."""
@@ -55,3 +58,35 @@ class Session:
     def create_child(self) -> "Session":
         """Create a child session that inherits from this one."""
         return Session(parent=self)
+
+    def _root(self) -> "Session":
+        root = self
+        while root._parent is not None:
+            root = root._parent
+        return root
+
+    def pin_clock(self) -> bool:
+        """Start pinning clock readings. Returns False if already pinned (nested run)."""
+        root = self._root()
+        if root._clock_pin is not None:
+            return False
+        root._clock_pin = []
+        return True
+
+    def unpin_clock(self) -> None:
+        """Stop pinning; later clock() calls read the system clock again."""
+        self._root()._clock_pin = None
+
+    def clock(self) -> float:
+        """
+        Current POSIX timestamp, fixed for the duration of one evaluation.
+
+        The first read inside an evaluation is remembered, so every Now(), Today()
+        and UtcNow() in one evaluate() call agree on the same instant.
+        """
+        pin = self._root()._clock_pin
+        if pin is None:
+            return time.time()
+        if not pin:
+            pin.append(time.time())
+        return pin[0]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC
 from dataclasses import dataclass
+from typing import Any, Callable
 
 
 class Node(ABC):
@@ -21,45 +22,45 @@ class Statement(Node):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class NumberLiteral(Expression):
     """Numeric literal (int, float, or complex)."""
     value: int | float | complex
 
 
-@dataclass
+@dataclass(frozen=True)
 class StringLiteral(Expression):
     """String literal."""
     value: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class Identifier(Expression):
     """Variable or function name reference."""
     name: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class NamedConstant(Expression):
     """Named constant reference like [[PI]]."""
     name: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class ArrayIndex(Expression):
     """Array indexing: arr[index]."""
     array: Expression
     index: Expression
 
 
-@dataclass
+@dataclass(frozen=True)
 class UnaryOp(Expression):
     """Unary operation: -x."""
     operator: str
     operand: Expression
 
 
-@dataclass
+@dataclass(frozen=True)
 class BinaryOp(Expression):
     """Binary operation: x + y."""
     operator: str
@@ -67,77 +68,114 @@ class BinaryOp(Expression):
     right: Expression
 
 
-@dataclass
+@dataclass(frozen=True)
 class FunctionCall(Expression):
     """Function call: Sin(x), Map(list, f)."""
     name: str
-    arguments: list[Expression | "LambdaExpr"]
+    arguments: tuple[Expression | "LambdaExpr", ...]
 
 
-@dataclass
+@dataclass(frozen=True)
 class LambdaExpr(Expression):
     """Lambda expression: x -> x^2, (x, y) -> x + y."""
-    parameters: list[str]
+    parameters: tuple[str, ...]
     body: Expression
 
 
-@dataclass
+@dataclass(frozen=True)
 class Assignment(Statement):
     """Variable assignment: x = expr."""
     name: str
     value: Expression | LambdaExpr
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExpressionStatement(Statement):
     """Standalone expression (printed to output)."""
     expression: Expression
 
 
-@dataclass
+@dataclass(frozen=True)
 class Program(Node):
     """Root node containing all statements."""
-    statements: list[Statement]
+    statements: tuple[Statement, ...]
+
+
+def _format_number(expr: NumberLiteral) -> str:
+    v = expr.value
+    if isinstance(v, complex):
+        if v.real == 0:
+            return f"{v.imag}i"
+        return f"({v.real} + {v.imag}i)"
+    return str(v)
+
+
+def _format_string(expr: StringLiteral) -> str:
+    return f'"{expr.value}"'
+
+
+def _format_identifier(expr: Identifier) -> str:
+    return expr.name
+
+
+def _format_named_constant(expr: NamedConstant) -> str:
+    return f"[[{expr.name}]]"
+
+
+def _format_array_index(expr: ArrayIndex) -> str:
+    return f"{expr_to_string(expr.array)}[{expr_to_string(expr.index)}]"
+
+
+def _format_unary(expr: UnaryOp) -> str:
+    return f"{expr.operator}{expr_to_string(expr.operand)}"
+
+
+def _format_binary(expr: BinaryOp) -> str:
+    left, right = expr.left, expr.right
+    left_str = expr_to_string(left)
+    right_str = expr_to_string(right)
+    # Add parens for nested binary ops to preserve meaning
+    if isinstance(left, BinaryOp):
+        left_str = f"({left_str})"
+    if isinstance(right, BinaryOp):
+        right_str = f"({right_str})"
+    return f"{left_str} {expr.operator} {right_str}"
+
+
+def _format_call(expr: FunctionCall) -> str:
+    args_str = ", ".join(expr_to_string(a) for a in expr.arguments)
+    return f"{expr.name}({args_str})"
+
+
+def _format_lambda(expr: LambdaExpr) -> str:
+    params = expr.parameters
+    body_str = expr_to_string(expr.body)
+    if not params:
+        return f"() -> {body_str}"
+    elif len(params) == 1:
+        return f"{params[0]} -> {body_str}"
+    else:
+        return f"({', '.join(params)}) -> {body_str}"
+
+
+def _format_unknown(expr: Expression) -> str:
+    return "<expr>"
+
+
+# Formatters keyed by exact node class: one dict lookup instead of a pattern cascade
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    NumberLiteral: _format_number,
+    StringLiteral: _format_string,
+    Identifier: _format_identifier,
+    NamedConstant: _format_named_constant,
+    ArrayIndex: _format_array_index,
+    UnaryOp: _format_unary,
+    BinaryOp: _format_binary,
+    FunctionCall: _format_call,
+    LambdaExpr: _format_lambda,
+}
 
 
 def expr_to_string(expr: Expression) -> str:
     """Reconstruct a string representation from an AST expression."""
-    match expr:
-        case NumberLiteral(value=v):
-            if isinstance(v, complex):
-                if v.real == 0:
-                    return f"{v.imag}i"
-                return f"({v.real} + {v.imag}i)"
-            return str(v)
-        case StringLiteral(value=v):
-            return f'"{v}"'
-        case Identifier(name=n):
-            return n
-        case NamedConstant(name=n):
-            return f"[[{n}]]"
-        case ArrayIndex(array=arr, index=idx):
-            return f"{expr_to_string(arr)}[{expr_to_string(idx)}]"
-        case UnaryOp(operator=op, operand=operand):
-            return f"{op}{expr_to_string(operand)}"
-        case BinaryOp(operator=op, left=left, right=right):
-            left_str = expr_to_string(left)
-            right_str = expr_to_string(right)
-            # Add parens for nested binary ops to preserve meaning
-            if isinstance(left, BinaryOp):
-                left_str = f"({left_str})"
-            if isinstance(right, BinaryOp):
-                right_str = f"({right_str})"
-            return f"{left_str} {op} {right_str}"
-        case FunctionCall(name=name, arguments=args):
-            args_str = ", ".join(expr_to_string(a) for a in args)
-            return f"{name}({args_str})"
-        case LambdaExpr(parameters=params, body=body):
-            body_str = expr_to_string(body)
-            if not params:
-                return f"() -> {body_str}"
-            elif len(params) == 1:
-                return f"{params[0]} -> {body_str}"
-            else:
-                return f"({', '.join(params)}) -> {body_str}"
-        case _:
-            return "<expr>"
+    return _FORMATTERS.get(type(expr), _format_unknown)(expr)
@@ -1,21 +1,34 @@
 """Parser that converts source text to AST using Lark."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from lark import Lark, Transformer, v_args, Token
 
 from mathlang.lang import ast
+from mathlang.lang.errors import SyntaxError
 
 
 _GRAMMAR_PATH = Path(__file__).parent / "grammar.lark"
 
+_SIGN_OPS = frozenset({"+", "-"})
+
+# Binding powers (left, right) for infix operators. Higher binds tighter;
+# a right power below the left one makes the operator right-associative.
+_INFIX_BP: dict[str, tuple[int, int]] = {
+    ">": (10, 11), ">=": (10, 11), "<": (10, 11), "<=": (10, 11), "==": (10, 11), "!=": (10, 11),
+    "+": (20, 21), "-": (20, 21),
+    "*": (30, 31), "/": (30, 31), "%": (30, 31),
+    "^": (41, 40),
+}
+
 
 @v_args(inline=True)
 class ASTTransformer(Transformer):
     """Transforms Lark parse tree into our AST nodes."""
 
     def program(self, *statements):
-        return ast.Program([s for s in statements if s is not None])
+        return ast.Program(tuple(s for s in statements if s is not None))
 
     def assignment(self, name, value):
         return ast.Assignment(str(name), value)
@@ -23,32 +36,52 @@ class ASTTransformer(Transformer):
     def expression_stmt(self, expr):
         return ast.ExpressionStatement(expr)
 
-    def single_param_lambda(self, param, _arrow, body):
-        return ast.LambdaExpr([str(param)], body)
-
-    def no_param_lambda(self, _empty, _arrow, body):
-        return ast.LambdaExpr([], body)
-
-    def multi_param_lambda(self, params, _arrow, body):
+    def lambda_expr(self, params, _arrow, body):
         return ast.LambdaExpr(params, body)
 
-    def param_list(self, *params):
-        return [str(p) for p in params]
-
-    def no_param_func_def(self, name, _empty_parens, body):
-        return ast.Assignment(str(name), ast.LambdaExpr([], body))
-
-    def single_param_func_def(self, name, param, body):
-        return ast.Assignment(str(name), ast.LambdaExpr([str(param)], body))
-
-    def multi_param_func_def(self, name, params, body):
-        return ast.Assignment(str(name), ast.LambdaExpr(params, body))
-
-    def func_def_params(self, *params):
-        return [str(p) for p in params]
-
-    def binary_op(self, left, op, right):
-        return ast.BinaryOp(str(op), left, right)
+    def lambda_params(self, *tokens):
+        return tuple(str(t) for t in tokens if t.type == "IDENTIFIER")
+
+    def func_def(self, head, body):
+        # The head was parsed as a call; its arguments become the parameters
+        params = []
+        for arg in head.arguments:
+            if not isinstance(arg, ast.Identifier):
+                raise SyntaxError(f"Parameters of '{head.name}' must be plain names")
+            params.append(arg.name)
+        return ast.Assignment(head.name, ast.LambdaExpr(tuple(params), body))
+
+    def binary_chain(self, *items):
+        # items alternate operand, op, operand, ...; fold them by binding power
+        # in a single pass with explicit stacks instead of recursing per operator
+        operands = [items[0]]
+        operators: list[tuple[str, int]] = []  # (operator, right binding power)
+        for pos in range(1, len(items), 2):
+            op = str(items[pos])
+            lbp, rbp = _INFIX_BP[op]
+            while operators and operators[-1][1] > lbp:
+                right = operands.pop()
+                operands.append(self._binary_op(operands.pop(), operators.pop()[0], right))
+            operators.append((op, rbp))
+            operands.append(items[pos + 1])
+        while operators:
+            right = operands.pop()
+            operands.append(self._binary_op(operands.pop(), operators.pop()[0], right))
+        return operands[0]
+
+    def _binary_op(self, left, op, right):
+        # Fold a real literal plus an imaginary literal (3+2i) into one complex literal
+        if (
+            op in _SIGN_OPS
+            and isinstance(left, ast.NumberLiteral)
+            and isinstance(right, ast.NumberLiteral)
+            and not isinstance(left.value, complex)
+            and isinstance(right.value, complex)
+            and right.value.real == 0
+        ):
+            imag = right.value.imag if op == "+" else -right.value.imag
+            return ast.NumberLiteral(complex(left.value, imag))
+        return ast.BinaryOp(op, left, right)
 
     def unary_op(self, op, operand):
         return ast.UnaryOp(str(op), operand)
@@ -60,10 +93,10 @@ class ASTTransformer(Transformer):
                 arguments.extend(arg)
             elif arg is not None:
                 arguments.append(arg)
-        return ast.FunctionCall(str(name), arguments)
+        return ast.FunctionCall(str(name), tuple(arguments))
 
     def no_arg_func_call(self, name, _empty_parens):
-        return ast.FunctionCall(str(name), [])
+        return ast.FunctionCall(str(name), ())
 
     def func_args(self, *args):
         return list(args)
@@ -81,7 +114,10 @@ class ASTTransformer(Transformer):
         return ast.Identifier(str(name))
 
     def number(self, token):
-        text = str(token).rstrip("uUlLfFdDmM")
+        text = str(token)
+        if text.isdecimal():  # Fast path for the common bare integer
+            return ast.NumberLiteral(int(text))
+        text = text.rstrip("uUlLfFdDmM")
         if "." in text or "e" in text.lower():
             return ast.NumberLiteral(float(text))
         elif text.startswith("0x") or text.startswith("0X"):
@@ -103,19 +139,24 @@ def _create_parser() -> Lark:
     return Lark(
         grammar,
         start="program",
-        parser="earley",  # Earley parser handles ambiguous grammars
-        ambiguity="resolve",  # Choose first match based on priority
+        parser="lalr",
+        lexer="contextual",  # One precompiled regex per parser state
+        transformer=ASTTransformer(),  # Build AST nodes during reduction, no parse tree
     )
 
 
 _parser: Lark | None = None
-_transformer = ASTTransformer()
 
 
+@lru_cache(maxsize=512)
 def parse(source: str) -> ast.Program:
-    """Parse source code and return the AST."""
+    """Parse source code and return the AST.
+
+    Results are cached by source text, so re-evaluating the same snippet (a REPL
+    loop, a formula re-run) skips parsing. AST nodes are frozen and never mutated
+    by the evaluator, which makes sharing the returned Program safe.
+    """
     global _parser
     if _parser is None:
         _parser = _create_parser()
-    tree = _parser.parse(source)
-    return _transformer.transform(tree)
+    return _parser.parse(source)
@@ -1,7 +1,9 @@
 """Arithmetic operations: Abs, Round, Floor, Ceiling, Sqrt, Random, etc."""
 
+import cmath
 import math
-import random
+import random as _random
+from functools import lru_cache, wraps
 from typing import TYPE_CHECKING
 
 from mathlang.operations.base import Operation, OperationProvider, ArgInfo
@@ -13,6 +15,70 @@ if TYPE_CHECKING:
     from mathlang.engine.session import Session
 
 
+_MISSING = object()
+
+
+def _has_zero(val) -> bool:
+    if isinstance(val, complex):
+        return val.real == 0 or val.imag == 0
+    return val == 0
+
+
+def _memoize(func):
+    """lru_cache func, except for arguments that are or contain a zero.
+
+    The cache key treats 0.0 and -0.0 as equal, but the sign of a zero picks the
+    side of a branch cut (Log(-4 - 0i)) or the sign of the result (Sqrt(-0.0)).
+    """
+    cached = lru_cache(maxsize=1024, typed=True)(func)
+
+    @wraps(func)
+    def kernel(val):
+        if _has_zero(val):
+            return func(val)
+        return cached(val)
+
+    return kernel
+
+
+# Memoized numeric kernels for the pure single-argument functions. typed=True keeps
+# 4, 4.0 and 4+0j apart so a cached real result is never returned for a complex input.
+# Errors propagate before anything is stored, so only successful results are cached.
+
+@_memoize
+def _pure_sqrt(val):
+    if isinstance(val, complex):
+        return val ** 0.5
+    if val < 0:
+        return complex(val) ** 0.5
+    return math.sqrt(val)
+
+
+@_memoize
+def _pure_log(val):
+    if isinstance(val, complex):
+        return cmath.log(val)
+    if val <= 0:
+        raise ArgumentError("Log requires a positive number")
+    return math.log(val)
+
+
+@_memoize
+def _pure_log10(val):
+    if isinstance(val, complex):
+        return cmath.log10(val)
+    if val <= 0:
+        raise ArgumentError("Log10 requires a positive number")
+    return math.log10(val)
+
+
+@_memoize
+def _pure_exp(val):
+    if isinstance(val, complex):
+        return cmath.exp(val)
+    return math.exp(val)
+
+
 class ArithmeticProvider(OperationProvider):
     """Provider for arithmetic operations."""
 
@@ -136,12 +202,7 @@ class ArithmeticProvider(OperationProvider):
         x = args[0]
         if not isinstance(x, Scalar):
             raise TypeError(f"Sqrt expects a number, got {x.type_name}")
-        val = x.value
-        if isinstance(val, complex):
-            return Scalar(val ** 0.5)
-        if val < 0:
-            return Scalar(complex(val) ** 0.5)
-        return Scalar(math.sqrt(val))
+        return Scalar(_pure_sqrt(x.value))
 
     def _floor(self, args: list["MathObject"], session: "Session") -> "MathObject":
         x = args[0]
@@ -170,67 +231,59 @@ class ArithmeticProvider(OperationProvider):
         x = args[0]
         if not isinstance(x, Scalar):
             raise TypeError(f"Log expects a number, got {x.type_name}")
-        val = x.value
-        if isinstance(val, complex):
-            import cmath
-            return Scalar(cmath.log(val))
-        if val <= 0:
-            raise ArgumentError("Log requires a positive number")
-        return Scalar(math.log(val))
+        return Scalar(_pure_log(x.value))
 
     def _log10(self, args: list["MathObject"], session: "Session") -> "MathObject":
         x = args[0]
         if not isinstance(x, Scalar):
             raise TypeError(f"Log10 expects a number, got {x.type_name}")
-        val = x.value
-        if isinstance(val, complex):
-            import cmath
-            return Scalar(cmath.log10(val))
-        if val <= 0:
-            raise ArgumentError("Log10 requires a positive number")
-        return Scalar(math.log10(val))
+        return Scalar(_pure_log10(x.value))
 
     def _exp(self, args: list["MathObject"], session: "Session") -> "MathObject":
         x = args[0]
         if not isinstance(x, Scalar):
             raise TypeError(f"Exp expects a number, got {x.type_name}")
-        val = x.value
-        if isinstance(val, complex):
-            import cmath
-            return Scalar(cmath.exp(val))
-        return Scalar(math.exp(val))
+        return Scalar(_pure_exp(x.value))
 
     def _min(self, args: list["MathObject"], session: "Session") -> "MathObject":
         if not args:
             raise ArgumentError("Min requires at least one argument")
-        values = []
+        # Validate and reduce in one pass; comparing mismatched values raises
+        # Python's TypeError, just as the builtin min() would
+        best = _MISSING
         for arg in args:
             if not isinstance(arg, Scalar):
                 raise TypeError(f"Min expects numbers, got {arg.type_name}")
-            values.append(arg.value)
-        return Scalar(min(values))
+            value = arg.value
+            if best is _MISSING or value < best:
+                best = value
+        return Scalar(best)
 
     def _max(self, args: list["MathObject"], session: "Session") -> "MathObject":
         if not args:
             raise ArgumentError("Max requires at least one argument")
-        values = []
+        # Validate and reduce in one pass; comparing mismatched values raises
+        # Python's TypeError, just as the builtin max() would
+        best = _MISSING
         for arg in args:
             if not isinstance(arg, Scalar):
                 raise TypeError(f"Max expects numbers, got {arg.type_name}")
-            values.append(arg.value)
-        return Scalar(max(values))
+            value = arg.value
+            if best is _MISSING or value > best:
+                best = value
+        return Scalar(best)
 
     def _random(self, args: list["MathObject"], session: "Session") -> "MathObject":
         if len(args) == 0:
-            return Scalar(random.random())
+            return Scalar(_random.random())
         elif len(args) == 1:
             if not isinstance(args[0], Scalar):
                 raise TypeError(f"Random expects a number, got {args[0].type_name}")
             n = int(args[0].value)
-            return Scalar(random.randint(0, n - 1))
+            return Scalar(_random.randint(0, n - 1))
         else:
             if not isinstance(args[0], Scalar) or not isinstance(args[1], Scalar):
                 raise TypeError("Random expects numbers")
             a = args[0].value
             b = args[1].value
-            return Scalar(random.uniform(a, b))
+            return Scalar(_random.uniform(a, b))
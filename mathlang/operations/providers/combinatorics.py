@@ -1,7 +1,7 @@
 """Combinatorics operations: Factorial, Permutations, Combinations, Fibonacci, etc."""
 
 import math
-from functools import lru_cache
+from itertools import compress
 from typing import TYPE_CHECKING
 
 from mathlang.operations.base import Operation, OperationProvider, ArgInfo
@@ -14,6 +14,22 @@ if TYPE_CHECKING:
     from mathlang.engine.session import Session
 
 
+_MISSING = object()
+_INT_TYPES = frozenset({int, bool})
+
+# Fibonacci numbers computed so far; indices are capped at 1000 by the operations,
+# so the table is extended at most once per index for the life of the process
+_FIB_CACHE: list[int] = [0, 1]
+
+
+def _fib(n: int) -> int:
+    """Return the nth Fibonacci number, extending the shared table as needed."""
+    cache = _FIB_CACHE
+    while len(cache) <= n:
+        cache.append(cache[-1] + cache[-2])
+    return cache[n]
+
+
 class CombinatoricsProvider(OperationProvider):
     """Provider for combinatorics operations."""
 
@@ -138,28 +154,30 @@ class CombinatoricsProvider(OperationProvider):
 
     def _get_non_negative_int(self, value: "MathObject", name: str) -> int:
         """Extract a non-negative integer from a MathObject."""
-        if not isinstance(value, Scalar):
-            raise TypeError(f"{name} must be an integer, got {value.type_name}")
-        if not isinstance(value.value, int):
-            raise TypeError(f"{name} must be an integer, got float")
-        if value.value < 0:
-            raise ArgumentError(f"{name} must be non-negative, got {value.value}")
-        return value.value
+        n = self._get_int(value, name)
+        if n < 0:
+            raise ArgumentError(f"{name} must be non-negative, got {n}")
+        return n
 
     def _get_positive_int(self, value: "MathObject", name: str) -> int:
         """Extract a positive integer from a MathObject."""
-        n = self._get_non_negative_int(value, name)
-        if n == 0:
+        n = self._get_int(value, name)
+        if n <= 0:
+            if n < 0:
+                raise ArgumentError(f"{name} must be non-negative, got {n}")
             raise ArgumentError(f"{name} must be positive, got 0")
         return n
 
     def _get_int(self, value: "MathObject", name: str) -> int:
         """Extract any integer from a MathObject."""
-        if not isinstance(value, Scalar):
-            raise TypeError(f"{name} must be an integer, got {value.type_name}")
-        if not isinstance(value.value, int):
+        # Exact type check instead of isinstance chains; bool is kept since it was
+        # accepted as an int subclass before
+        n = getattr(value, "value", _MISSING)
+        if type(n) not in _INT_TYPES:
+            if n is _MISSING:
+                raise TypeError(f"{name} must be an integer, got {value.type_name}")
             raise TypeError(f"{name} must be an integer, got float")
-        return value.value
+        return n
 
     def _factorial(self, args: list["MathObject"], session: "Session") -> "MathObject":
         n = self._get_non_negative_int(args[0], "n")
@@ -185,33 +203,16 @@ class CombinatoricsProvider(OperationProvider):
         n = self._get_non_negative_int(args[0], "n")
         if n > 1000:
             raise ArgumentError(f"Fibonacci index too large: {n}")
-        return Scalar(self._fib(n))
-
-    @staticmethod
-    @lru_cache(maxsize=1024)
-    def _fib(n: int) -> int:
-        """Calculate nth Fibonacci number using matrix exponentiation."""
-        if n <= 1:
-            return n
-
-        # Use iterative approach for large n
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
+        return Scalar(_fib(n))
 
     def _fibonacci_list(self, args: list["MathObject"], session: "Session") -> "MathObject":
         n = self._get_positive_int(args[0], "n")
         if n > 1000:
             raise ArgumentError(f"Too many Fibonacci numbers requested: {n}")
 
-        fibs = []
-        a, b = 0, 1
-        for _ in range(n):
-            fibs.append(Scalar(a))
-            a, b = b, a + b
-
-        return List(fibs)
+        _fib(n - 1)  # Extend the shared table far enough
+        scalar = Scalar
+        return List([scalar(f) for f in _FIB_CACHE[:n]])
 
     def _gcd(self, args: list["MathObject"], session: "Session") -> "MathObject":
         a = self._get_int(args[0], "a")
@@ -246,13 +247,14 @@ class CombinatoricsProvider(OperationProvider):
         d = 2
         while d * d <= n:
             while n % d == 0:
-                factors.append(Scalar(d))
+                factors.append(d)
                 n //= d
             d += 1
         if n > 1:
-            factors.append(Scalar(n))
+            factors.append(n)
 
-        return List(factors)
+        scalar = Scalar  # Local alias: LOAD_FAST instead of a global lookup per item
+        return List([scalar(f) for f in factors])
 
     def _primes(self, args: list["MathObject"], session: "Session") -> "MathObject":
         n = self._get_non_negative_int(args[0], "n")
@@ -261,17 +263,17 @@ class CombinatoricsProvider(OperationProvider):
         if n > 1000000:
             raise ArgumentError(f"Upper limit too large: {n}")
 
-        # Sieve of Eratosthenes
-        sieve = [True] * (n + 1)
-        sieve[0] = sieve[1] = False
+        # Sieve of Eratosthenes over a bytearray; striking out multiples is a
+        # single slice assignment, so the inner loop runs in C
+        sieve = bytearray([1]) * (n + 1)
+        sieve[0] = sieve[1] = 0
 
-        for i in range(2, int(math.sqrt(n)) + 1):
+        for i in range(2, math.isqrt(n) + 1):
             if sieve[i]:
-                for j in range(i * i, n + 1, i):
-                    sieve[j] = False
+                sieve[i * i::i] = bytes(len(range(i * i, n + 1, i)))
 
-        primes = [Scalar(i) for i, is_prime in enumerate(sieve) if is_prime]
-        return List(primes)
+        scalar = Scalar
+        return List([scalar(i) for i in compress(range(n + 1), sieve)])
 
     def _binomial_coeff(self, args: list["MathObject"], session: "Session") -> "MathObject":
         n = self._get_non_negative_int(args[0], "n")
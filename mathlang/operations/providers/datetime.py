@@ -1,6 +1,7 @@
 """DateTime operations: Now, Today, Date, AddDays, etc."""
 
 from datetime import datetime, date, timedelta, UTC
+from itertools import accumulate
 from typing import TYPE_CHECKING
 
 from mathlang.operations.base import Operation, OperationProvider, ArgInfo
@@ -13,6 +14,54 @@ if TYPE_CHECKING:
     from mathlang.engine.session import Session
 
 
+# Month lengths for a common year; February gains a day in leap years
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Days in a common year before the first of each month
+_DAYS_BEFORE_MONTH = (0, *accumulate(_DAYS_IN_MONTH[:-1]))
+
+
+def _is_leap(year: int) -> bool:
+    """Gregorian leap-year rule.
+
+    Once year is a multiple of 4, "divisible by 100" reduces to "divisible by 25"
+    and "divisible by 400" to "divisible by 16", so two of the checks are masks.
+    """
+    return year & 3 == 0 and (year % 25 != 0 or year & 15 == 0)
+
+
+def _days_in(year: int, month: int) -> int:
+    """Number of days in a month (1-12) of the given year."""
+    if month == 2 and _is_leap(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+# Month lengths over one full 400-year Gregorian cycle, indexed by
+# (year % 400) * 12 + month - 1; the calendar repeats exactly every 400 years
+_MONTH_LEN_CYCLE = tuple(_days_in(y, m) for y in range(400) for m in range(1, 13))
+
+
+# Hand-built renderings of the most common FormatDateTime patterns, skipping
+# strftime's format parsing. Each returns None when it can't match strftime
+# exactly (platform strftime doesn't zero-pad years below 1000).
+
+def _format_ymd(dt: datetime) -> str | None:
+    if dt.year < 1000:
+        return None
+    return f"{dt.year}-{dt.month:02d}-{dt.day:02d}"
+
+
+def _format_hm(dt: datetime) -> str:
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+_FAST_FORMATS = {
+    "%Y-%m-%d": _format_ymd,
+    "%H:%M": _format_hm,
+}
+
+
 class DateTime(Scalar):
     """A datetime value that displays nicely."""
 
@@ -76,6 +125,15 @@ class DateTimeProvider(OperationProvider):
             execute=self._utc_now,
         ))
 
+        self.register(Operation(
+            identifier="NowFresh",
+            friendly_name="Now (Fresh)",
+            description="Returns the current datetime, read from the clock on every call",
+            category="DateTime/Current",
+            required_args=[],
+            execute=self._now_fresh,
+        ))
+
         self.register(Operation(
             identifier="DateOf",
             friendly_name="Create Date",
@@ -319,22 +377,30 @@ class DateTimeProvider(OperationProvider):
             return datetime.combine(value.value, datetime.min.time())
         raise TypeError(f"{name} must be a date or datetime, got {value.type_name}")
 
-    def _get_date(self, value: "MathObject", name: str) -> date:
-        """Extract a date from a MathObject."""
-        if isinstance(value, Date):
+    def _get_temporal(self, value: "MathObject", name: str) -> date:
+        """Extract the underlying date or datetime without converting between them.
+
+        Component reads work on either (datetime subclasses date), so unlike
+        _get_datetime this never allocates a converted copy.
+        """
+        if isinstance(value, (Date, DateTime)):
             return value.value
-        if isinstance(value, DateTime):
-            return value.value.date()
         raise TypeError(f"{name} must be a date or datetime, got {value.type_name}")
 
+    # Now, Today and UtcNow read the session clock, which is pinned for one
+    # evaluation, so repeated calls in a script agree with each other
+
     def _now(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        return DateTime(datetime.now())
+        return DateTime(datetime.fromtimestamp(session.clock()))
 
     def _today(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        return Date(date.today())
+        return Date(date.fromtimestamp(session.clock()))
 
     def _utc_now(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        return DateTime(datetime.now(UTC).replace(tzinfo=None))
+        return DateTime(datetime.fromtimestamp(session.clock(), UTC).replace(tzinfo=None))
+
+    def _now_fresh(self, args: list["MathObject"], session: "Session") -> "MathObject":
+        return DateTime(datetime.now())
 
     def _date_of(self, args: list["MathObject"], session: "Session") -> "MathObject":
         year = self._get_int(args[0], "year")
@@ -360,8 +426,12 @@ class DateTimeProvider(OperationProvider):
             raise ArgumentError(str(e))
 
     def _add_days(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_datetime(args[0], "dt")
         days = self._get_number(args[1], "days")
+        if isinstance(args[0], Date) and days.is_integer():
+            # Whole days on a date: shift its day ordinal, no datetime round-trip
+            return Date(date.fromordinal(args[0].value.toordinal() + int(days)))
+
+        dt = self._get_datetime(args[0], "dt")
         result = dt + timedelta(days=days)
 
         if isinstance(args[0], Date):
@@ -379,104 +449,109 @@ class DateTimeProvider(OperationProvider):
         return DateTime(dt + timedelta(minutes=minutes))
 
     def _add_months(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_datetime(args[0], "dt")
+        dt = self._get_temporal(args[0], "dt")
         months = self._get_int(args[1], "months")
 
         # Calculate new month and year
-        new_month = dt.month + months
-        new_year = dt.year + (new_month - 1) // 12
-        new_month = ((new_month - 1) % 12) + 1
+        total = dt.month - 1 + months
+        new_year = dt.year + total // 12
+        month_index = total % 12
 
         # Handle day overflow (e.g., Jan 31 + 1 month = Feb 28/29)
-        import calendar
-        max_day = calendar.monthrange(new_year, new_month)[1]
+        max_day = _MONTH_LEN_CYCLE[(new_year % 400) * 12 + month_index]
         new_day = min(dt.day, max_day)
 
-        result = dt.replace(year=new_year, month=new_month, day=new_day)
+        # replace() keeps the input's type, so dates never round-trip through datetime
+        result = dt.replace(year=new_year, month=month_index + 1, day=new_day)
 
         if isinstance(args[0], Date):
-            return Date(result.date())
+            return Date(result)
         return DateTime(result)
 
     def _add_years(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_datetime(args[0], "dt")
+        dt = self._get_temporal(args[0], "dt")
         years = self._get_int(args[1], "years")
 
         new_year = dt.year + years
 
         # Handle Feb 29 in leap year to non-leap year
-        import calendar
         new_day = dt.day
-        if dt.month == 2 and dt.day == 29 and not calendar.isleap(new_year):
+        if dt.month == 2 and dt.day == 29 and not _is_leap(new_year):
             new_day = 28
 
         result = dt.replace(year=new_year, day=new_day)
 
         if isinstance(args[0], Date):
-            return Date(result.date())
+            return Date(result)
         return DateTime(result)
 
     def _days_between(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        d1 = self._get_date(args[0], "dt1")
-        d2 = self._get_date(args[1], "dt2")
-        return Scalar((d2 - d1).days)
+        d1 = self._get_temporal(args[0], "dt1")
+        d2 = self._get_temporal(args[1], "dt2")
+        # Ordinals are day counts, so the difference needs no timedelta
+        return Scalar.of(d2.toordinal() - d1.toordinal())
 
     def _year(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_date(args[0], "dt")
-        return Scalar(dt.year)
+        dt = self._get_temporal(args[0], "dt")
+        return Scalar.of(dt.year)
 
     def _month(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_date(args[0], "dt")
-        return Scalar(dt.month)
+        dt = self._get_temporal(args[0], "dt")
+        return Scalar.of(dt.month)
 
     def _day(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_date(args[0], "dt")
-        return Scalar(dt.day)
+        dt = self._get_temporal(args[0], "dt")
+        return Scalar.of(dt.day)
 
     def _hour(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_datetime(args[0], "dt")
-        return Scalar(dt.hour)
+        dt = self._get_temporal(args[0], "dt")
+        return Scalar.of(dt.hour if isinstance(dt, datetime) else 0)
 
     def _minute(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_datetime(args[0], "dt")
-        return Scalar(dt.minute)
+        dt = self._get_temporal(args[0], "dt")
+        return Scalar.of(dt.minute if isinstance(dt, datetime) else 0)
 
     def _second(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_datetime(args[0], "dt")
-        return Scalar(dt.second)
+        dt = self._get_temporal(args[0], "dt")
+        return Scalar.of(dt.second if isinstance(dt, datetime) else 0)
 
     def _day_of_week(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_date(args[0], "dt")
-        return Scalar(dt.weekday())
+        dt = self._get_temporal(args[0], "dt")
+        return Scalar.of(dt.weekday())
 
     def _day_of_year(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_date(args[0], "dt")
-        return Scalar(dt.timetuple().tm_yday)
+        dt = self._get_temporal(args[0], "dt")
+        leap_day = 1 if dt.month > 2 and _is_leap(dt.year) else 0
+        return Scalar.of(_DAYS_BEFORE_MONTH[dt.month - 1] + dt.day + leap_day)
 
     def _week_of_year(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        dt = self._get_date(args[0], "dt")
-        return Scalar(dt.isocalendar()[1])
+        dt = self._get_temporal(args[0], "dt")
+        return Scalar.of(dt.isocalendar()[1])
 
     def _format_datetime(self, args: list["MathObject"], session: "Session") -> "MathObject":
         dt = self._get_datetime(args[0], "dt")
         pattern = self._get_string(args[1], "pattern")
 
+        fast = _FAST_FORMATS.get(pattern)
+        if fast is not None:
+            text = fast(dt)
+            if text is not None:
+                return Scalar(text)
+
         try:
             return Scalar(dt.strftime(pattern))
         except ValueError as e:
             raise ArgumentError(f"Invalid format pattern: {e}")
 
     def _is_leap_year(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        import calendar
         year = self._get_int(args[0], "year")
-        return Scalar(1 if calendar.isleap(year) else 0)
+        return Scalar.of(1 if _is_leap(year) else 0)
 
     def _days_in_month(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        import calendar
         year = self._get_int(args[0], "year")
         month = self._get_int(args[1], "month")
 
         if month < 1 or month > 12:
             raise ArgumentError(f"Month must be between 1 and 12, got {month}")
 
-        return Scalar(calendar.monthrange(year, month)[1])
+        return Scalar.of(_days_in(year, month))
@@ -87,17 +87,17 @@ class LogicalProvider(OperationProvider):
     def _and(self, args: list["MathObject"], session: "Session") -> "MathObject":
         for arg in args:
             if not is_truthy(arg):
-                return Scalar(False)
-        return Scalar(True)
+                return Scalar.of(False)
+        return Scalar.of(True)
 
     def _or(self, args: list["MathObject"], session: "Session") -> "MathObject":
         for arg in args:
             if is_truthy(arg):
-                return Scalar(True)
-        return Scalar(False)
+                return Scalar.of(True)
+        return Scalar.of(False)
 
     def _not(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        return Scalar(not is_truthy(args[0]))
+        return Scalar.of(not is_truthy(args[0]))
 
     def _if(self, args: list["MathObject"], session: "Session") -> "MathObject":
         condition, then_value, else_value = args
@@ -110,19 +110,19 @@ class LogicalProvider(OperationProvider):
     def _is_nan(self, args: list["MathObject"], session: "Session") -> "MathObject":
         x = args[0]
         if not isinstance(x, Scalar):
-            return Scalar(False)
+            return Scalar.of(False)
         import math
         val = x.value
         if isinstance(val, (int, float)):
-            return Scalar(math.isnan(val))
-        return Scalar(False)
+            return Scalar.of(math.isnan(val))
+        return Scalar.of(False)
 
     def _is_inf(self, args: list["MathObject"], session: "Session") -> "MathObject":
         x = args[0]
         if not isinstance(x, Scalar):
-            return Scalar(False)
+            return Scalar.of(False)
         import math
         val = x.value
         if isinstance(val, (int, float)):
-            return Scalar(math.isinf(val))
-        return Scalar(False)
+            return Scalar.of(math.isinf(val))
+        return Scalar.of(False)
@@ -1,6 +1,7 @@
 """Statistics operations: Mean, Median, StdDev, Variance, etc."""
 
 import math
+from operator import mul
 from typing import TYPE_CHECKING
 
 from mathlang.operations.base import Operation, OperationProvider, ArgInfo
@@ -13,11 +14,29 @@ def _is_collection(obj: "MathObject") -> bool:
     """Check if an object is a collection (List or Interval)."""
     return isinstance(obj, (List, Interval))
 
+
 if TYPE_CHECKING:
     from mathlang.types.base import MathObject
     from mathlang.engine.session import Session
 
 
+def _centered(values: list[float]) -> tuple[float, list[float]]:
+    """Return the mean of values and each value's deviation from it."""
+    first = values[0]
+    if all(x == first for x in values):
+        # Constant input: sum()/n can round to a mean that differs from the value
+        # itself, which would leave tiny non-zero deviations behind. NaN never
+        # compares equal, so data containing one takes the normal path.
+        return first, [0.0] * len(values)
+    mean = sum(values) / len(values)
+    return mean, [x - mean for x in values]
+
+
+def _dot(a: list[float], b: list[float]) -> float:
+    """Sum of pairwise products, looped in C via map/sum."""
+    return sum(map(mul, a, b))
+
+
 class StatisticsProvider(OperationProvider):
     """Provider for statistics operations."""
 
@@ -165,10 +184,11 @@ class StatisticsProvider(OperationProvider):
             return coll.to_list()
 
         values = []
+        append = values.append
         for item in coll:
             if not isinstance(item, Scalar) or isinstance(item.value, str):
                 raise TypeError(f"{name} must contain only numbers, got {item.type_name}")
-            values.append(float(item.value))
+            append(float(item.value))
         return values
 
     def _mean(self, args: list["MathObject"], session: "Session") -> "MathObject":
@@ -213,22 +233,14 @@ class StatisticsProvider(OperationProvider):
         return List(modes)
 
     def _calculate_variance(self, values: list[float], sample: bool = True) -> float:
-        """Calculate variance using Welford's online algorithm (single-pass, numerically stable)."""
+        """Calculate variance as the sum of squared deviations from the mean (two-pass, stable)."""
         n = len(values)
         if n < 2:
             raise ArgumentError("Need at least 2 values to calculate variance")
 
-        # Welford's algorithm: single pass, numerically stable
-        mean = 0.0
-        m2 = 0.0
-        for i, x in enumerate(values, 1):
-            delta = x - mean
-            mean += delta / i
-            delta2 = x - mean
-            m2 += delta * delta2
-
+        _, dev = _centered(values)
         divisor = n - 1 if sample else n
-        return m2 / divisor
+        return _dot(dev, dev) / divisor
 
     def _variance(self, args: list["MathObject"], session: "Session") -> "MathObject":
         values = self._extract_numbers(args[0])
@@ -255,24 +267,13 @@ class StatisticsProvider(OperationProvider):
         if len(x_values) < 2:
             raise ArgumentError("Need at least 2 values to calculate correlation")
 
-        # Single-pass algorithm using online covariance
-        n = 0
-        mean_x = 0.0
-        mean_y = 0.0
-        c = 0.0  # Co-moment
-        m2_x = 0.0  # Sum of squared deviations for x
-        m2_y = 0.0  # Sum of squared deviations for y
-
-        for x, y in zip(x_values, y_values):
-            n += 1
-            dx = x - mean_x
-            mean_x += dx / n
-            dy = y - mean_y
-            mean_y += dy / n
-            # Update co-moment and variances
-            c += dx * (y - mean_y)
-            m2_x += dx * (x - mean_x)
-            m2_y += dy * (y - mean_y)
+        # Two-pass: center both lists, then accumulate the co-moment and squared
+        # deviations with C-level map/sum instead of a per-element Python loop
+        _, dx = _centered(x_values)
+        _, dy = _centered(y_values)
+        c = _dot(dx, dy)
+        m2_x = _dot(dx, dx)
+        m2_y = _dot(dy, dy)
 
         if m2_x == 0 or m2_y == 0:
             return Scalar(0.0)
@@ -288,20 +289,9 @@ class StatisticsProvider(OperationProvider):
         if len(x_values) < 2:
             raise ArgumentError("Need at least 2 values to calculate covariance")
 
-        # Single-pass algorithm
-        n = 0
-        mean_x = 0.0
-        mean_y = 0.0
-        c = 0.0  # Co-moment
-
-        for x, y in zip(x_values, y_values):
-            n += 1
-            dx = x - mean_x
-            mean_x += dx / n
-            mean_y += (y - mean_y) / n
-            c += dx * (y - mean_y)
-
-        return Scalar(c / (n - 1))
+        _, dx = _centered(x_values)
+        _, dy = _centered(y_values)
+        return Scalar(_dot(dx, dy) / (len(dx) - 1))
 
     def _linear_regression(self, args: list["MathObject"], session: "Session") -> "MathObject":
         x_values = self._extract_numbers(args[0], "x_values")
@@ -312,24 +302,11 @@ class StatisticsProvider(OperationProvider):
         if len(x_values) < 2:
             raise ArgumentError("Need at least 2 points for linear regression")
 
-        # Single-pass algorithm for slope, intercept, and R-squared
-        n = 0
-        mean_x = 0.0
-        mean_y = 0.0
-        c = 0.0   # Co-moment (for covariance)
-        m2_x = 0.0  # Sum of squared deviations for x
-        m2_y = 0.0  # Sum of squared deviations for y
-
-        for x, y in zip(x_values, y_values):
-            n += 1
-            dx = x - mean_x
-            mean_x += dx / n
-            dy = y - mean_y
-            mean_y += dy / n
-            # Update using corrected values
-            c += dx * (y - mean_y)
-            m2_x += dx * (x - mean_x)
-            m2_y += dy * (y - mean_y)
+        mean_x, dx = _centered(x_values)
+        mean_y, dy = _centered(y_values)
+        c = _dot(dx, dy)   # Co-moment (for covariance)
+        m2_x = _dot(dx, dx)  # Sum of squared deviations for x
+        m2_y = _dot(dy, dy)  # Sum of squared deviations for y
 
         if m2_x == 0:
             raise ArgumentError("Cannot perform regression: all x values are identical")
@@ -1,6 +1,7 @@
 """Vector operations: Vector creation, DotProduct, CrossProduct, Magnitude, etc."""
 
 import math
+from operator import add, mul, sub
 from typing import TYPE_CHECKING
 
 from mathlang.operations.base import Operation, OperationProvider, ArgInfo
@@ -14,6 +15,26 @@ if TYPE_CHECKING:
     from mathlang.engine.session import Session
 
 
+# Component-wise kernels over plain float lists. Each runs its per-component loop
+# in C through map/sum and takes the same path for every dimension.
+
+def _dot(v1: list[float], v2: list[float]) -> float:
+    # sum() compensates float rounding on Python 3.12+, which a chain of + does not
+    return sum(map(mul, v1, v2))
+
+
+def _add(v1: list[float], v2: list[float]) -> list[float]:
+    return list(map(add, v1, v2))
+
+
+def _sub(v1: list[float], v2: list[float]) -> list[float]:
+    return list(map(sub, v1, v2))
+
+
+def _norm(v: list[float]) -> float:
+    return math.hypot(*v)
+
+
 class VectorsProvider(OperationProvider):
     """Provider for vector operations."""
 
@@ -188,7 +209,7 @@ class VectorsProvider(OperationProvider):
     def _extract_vector(self, value: "MathObject", name: str) -> list[float]:
         """Extract numeric components from a Vector, List, or Interval."""
         if isinstance(value, Vector):
-            return [float(v) for v in value.values]
+            return list(map(float, value.values))
         if isinstance(value, Interval):
             # Interval contains only numbers, use optimized to_list()
             return value.to_list()
@@ -220,7 +241,7 @@ class VectorsProvider(OperationProvider):
         if len(v1) != len(v2):
             raise ArgumentError(f"Vectors must have same dimension: {len(v1)} vs {len(v2)}")
 
-        return Scalar(sum(a * b for a, b in zip(v1, v2)))
+        return Scalar(_dot(v1, v2))
 
     def _cross_product(self, args: list["MathObject"], session: "Session") -> "MathObject":
         v1 = self._extract_vector(args[0], "v1")
@@ -229,20 +250,17 @@ class VectorsProvider(OperationProvider):
         if len(v1) != 3 or len(v2) != 3:
             raise ArgumentError("Cross product requires 3D vectors")
 
-        result = [
-            v1[1] * v2[2] - v1[2] * v2[1],
-            v1[2] * v2[0] - v1[0] * v2[2],
-            v1[0] * v2[1] - v1[1] * v2[0],
-        ]
-        return Vector(result)
+        x1, y1, z1 = v1
+        x2, y2, z2 = v2
+        return Vector([y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2])
 
     def _magnitude(self, args: list["MathObject"], session: "Session") -> "MathObject":
         v = self._extract_vector(args[0], "v")
-        return Scalar(math.sqrt(sum(x * x for x in v)))
+        return Scalar(_norm(v))
 
     def _normalize(self, args: list["MathObject"], session: "Session") -> "MathObject":
         v = self._extract_vector(args[0], "v")
-        mag = math.sqrt(sum(x * x for x in v))
+        mag = _norm(v)
 
         if mag == 0:
             raise ArgumentError("Cannot normalize zero vector")
@@ -256,16 +274,24 @@ class VectorsProvider(OperationProvider):
         if len(v1) != len(v2):
             raise ArgumentError(f"Vectors must have same dimension: {len(v1)} vs {len(v2)}")
 
-        dot = sum(a * b for a, b in zip(v1, v2))
-        mag1 = math.sqrt(sum(x * x for x in v1))
-        mag2 = math.sqrt(sum(x * x for x in v2))
+        dot = _dot(v1, v2)
+        mag1 = _norm(v1)
+        mag2 = _norm(v2)
 
         if mag1 == 0 or mag2 == 0:
             raise ArgumentError("Cannot calculate angle with zero vector")
 
+        # Orthogonal vectors need no acos
+        if dot == 0:
+            return Scalar(math.pi / 2)
+
         cos_angle = dot / (mag1 * mag2)
-        # Clamp to handle floating point errors
-        cos_angle = max(-1, min(1, cos_angle))
+        # Clamp to handle floating point errors; this also makes (anti)parallel
+        # vectors whose cosine rounds past +-1 come out as exactly 0 or pi
+        if cos_angle >= 1.0:
+            return Scalar(0.0)
+        if cos_angle <= -1.0:
+            return Scalar(math.pi)
         return Scalar(math.acos(cos_angle))
 
     def _vec_add(self, args: list["MathObject"], session: "Session") -> "MathObject":
@@ -275,7 +301,7 @@ class VectorsProvider(OperationProvider):
         if len(v1) != len(v2):
             raise ArgumentError(f"Vectors must have same dimension: {len(v1)} vs {len(v2)}")
 
-        return Vector([a + b for a, b in zip(v1, v2)])
+        return Vector(_add(v1, v2))
 
     def _vec_sub(self, args: list["MathObject"], session: "Session") -> "MathObject":
         v1 = self._extract_vector(args[0], "v1")
@@ -284,7 +310,7 @@ class VectorsProvider(OperationProvider):
         if len(v1) != len(v2):
             raise ArgumentError(f"Vectors must have same dimension: {len(v1)} vs {len(v2)}")
 
-        return Vector([a - b for a, b in zip(v1, v2)])
+        return Vector(_sub(v1, v2))
 
     def _vec_scale(self, args: list["MathObject"], session: "Session") -> "MathObject":
         v = self._extract_vector(args[0], "v")
@@ -353,8 +379,8 @@ class VectorsProvider(OperationProvider):
         if len(v1) != len(v2):
             raise ArgumentError(f"Vectors must have same dimension: {len(v1)} vs {len(v2)}")
 
-        dot_v1_v2 = sum(a * b for a, b in zip(v1, v2))
-        dot_v2_v2 = sum(x * x for x in v2)
+        dot_v1_v2 = _dot(v1, v2)
+        dot_v2_v2 = _dot(v2, v2)
 
         if dot_v2_v2 == 0:
             raise ArgumentError("Cannot project onto zero vector")
@@ -1,6 +1,7 @@
 """Visualization operations: Plot, Plot3D, Histogram, Scatter."""
 
-from typing import TYPE_CHECKING
+import math
+from typing import TYPE_CHECKING, Callable, Iterable
 
 from mathlang.operations.base import Operation, OperationProvider, ArgInfo
 from mathlang.types.scalar import Scalar
@@ -14,6 +15,46 @@ if TYPE_CHECKING:
     from mathlang.engine.session import Session
 
 
+def _as_float(value: object) -> float:
+    """Convert a compiled lambda's raw result the way plotting converts a Scalar."""
+    if isinstance(value, str):
+        raise TypeError("Function must return a number, got String")
+    return float(value)
+
+
+def _bin_uniform(values: list[float], bins: int) -> tuple[list[float], list[int]]:
+    """Count values into equal-width bins spanning their range.
+
+    Mirrors numpy.histogram's uniform-bin path (the one matplotlib uses): scale each
+    value straight to a bin index, then nudge indices that float rounding put on the
+    wrong side of an edge. Returns empty lists if any value or the span isn't finite.
+    """
+    # min/max can skip a NaN that isn't first, so check every value
+    if not all(map(math.isfinite, values)):
+        return [], []
+    lo, hi = min(values), max(values)
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+
+    width = hi - lo
+    if not math.isfinite(width):
+        return [], []
+    step = width / bins
+    edges = [lo + i * step for i in range(bins)]
+    edges.append(hi)
+
+    counts = [0] * bins
+    last = bins - 1
+    for v in values:
+        i = min(int((v - lo) / width * bins), last)
+        if v < edges[i]:
+            i -= 1
+        elif i != last and v >= edges[i + 1]:
+            i += 1
+        counts[i] += 1
+    return edges, counts
+
+
 class VisualizationProvider(OperationProvider):
     """Provider for visualization operations."""
 
@@ -134,12 +175,22 @@ class VisualizationProvider(OperationProvider):
             raise TypeError(f"{name} must be a list, got {value.type_name}")
 
         result = []
+        append = result.append
         for item in value:
             if not isinstance(item, Scalar) or isinstance(item.value, str):
                 raise TypeError(f"{name} must contain only numbers")
-            result.append(float(item.value))
+            append(float(item.value))
         return result
 
+    def _extract_pair(self, x: "MathObject", y: "MathObject") -> tuple[list[float], list[float]]:
+        """Extract matching x and y float lists, checking lengths before any element."""
+        for value, name in ((x, "x_values"), (y, "y_values")):
+            if not isinstance(value, List):
+                raise TypeError(f"{name} must be a list, got {value.type_name}")
+        if len(x) != len(y):
+            raise ArgumentError(f"x and y must have same length: {len(x)} vs {len(y)}")
+        return self._extract_list(x, "x_values"), self._extract_list(y, "y_values")
+
     def _get_number(self, value: "MathObject", name: str) -> float:
         """Extract a number from a MathObject."""
         if not isinstance(value, Scalar) or isinstance(value.value, str):
@@ -191,6 +242,50 @@ class VisualizationProvider(OperationProvider):
             raise TypeError(f"Function must return a number, got {result.type_name}")
         return float(result.value)
 
+    def _sample(
+        self,
+        func: Lambda,
+        arity: int,
+        points: Iterable[tuple[float, ...]],
+        evaluate_point: Callable[..., float],
+        session: "Session",
+    ) -> list[float]:
+        """Evaluate an arity-argument lambda at each point, with NaN where evaluation fails.
+
+        Bodies that compile to a raw-value closure skip the per-point child session
+        and Scalar boxing; any point the closure can't handle is re-run through
+        evaluate_point (the interpreter), so results match evaluating it directly.
+        """
+        from mathlang.engine.compiler import compile_lambda
+
+        compiled = compile_lambda(func, session) if func.arity == arity else None
+        values = []
+        for point in points:
+            if compiled is not None:
+                try:
+                    values.append(_as_float(compiled(*point)))
+                    continue
+                except Exception:
+                    pass
+            try:
+                values.append(evaluate_point(func, *point, session))
+            except Exception:
+                values.append(float('nan'))
+        return values
+
+    def _sample_function(self, func: Lambda, x_values: list[float], session: "Session") -> list[float]:
+        """Evaluate a single-argument lambda at each x, with NaN where evaluation fails."""
+        return self._sample(func, 1, zip(x_values), self._evaluate_function, session)
+
+    def _sample_function_2d(
+        self, func: Lambda, x_values: list[float], y_values: list[float], session: "Session"
+    ) -> list[list[float]]:
+        """Evaluate a two-argument lambda over the x/y grid (one row per y), NaN on failure."""
+        grid = ((x, y) for y in y_values for x in x_values)
+        flat = self._sample(func, 2, grid, self._evaluate_function_2d, session)
+        width = len(x_values)
+        return [flat[i:i + width] for i in range(0, len(flat), width)]
+
     def _plot(self, args: list["MathObject"], session: "Session") -> "MathObject":
         first_arg = args[0]
 
@@ -212,14 +307,7 @@ class VisualizationProvider(OperationProvider):
 
             step = (x_max - x_min) / (points - 1)
             x_values = [x_min + i * step for i in range(points)]
-            y_values = []
-
-            for x in x_values:
-                try:
-                    y = self._evaluate_function(func, x, session)
-                    y_values.append(y)
-                except Exception:
-                    y_values.append(float('nan'))
+            y_values = self._sample_function(func, x_values, session)
 
             return PlotData2D(x_values=x_values, y_values=y_values)
 
@@ -228,11 +316,7 @@ class VisualizationProvider(OperationProvider):
             if len(args) < 2 or not isinstance(args[1], List):
                 raise ArgumentError("Plot with data requires x_values and y_values lists")
 
-            x_values = self._extract_list(first_arg, "x_values")
-            y_values = self._extract_list(args[1], "y_values")
-
-            if len(x_values) != len(y_values):
-                raise ArgumentError(f"x and y must have same length: {len(x_values)} vs {len(y_values)}")
+            x_values, y_values = self._extract_pair(first_arg, args[1])
 
             return PlotData2D(x_values=x_values, y_values=y_values)
 
@@ -240,13 +324,9 @@ class VisualizationProvider(OperationProvider):
             raise TypeError(f"Plot expects a function or list, got {first_arg.type_name}")
 
     def _plot_data(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        x_values = self._extract_list(args[0], "x_values")
-        y_values = self._extract_list(args[1], "y_values")
+        x_values, y_values = self._extract_pair(args[0], args[1])
         title = self._get_string(args[2] if len(args) > 2 else None, "title")
 
-        if len(x_values) != len(y_values):
-            raise ArgumentError(f"x and y must have same length: {len(x_values)} vs {len(y_values)}")
-
         return PlotData2D(x_values=x_values, y_values=y_values, title=title)
 
     def _plot3d(self, args: list["MathObject"], session: "Session") -> "MathObject":
@@ -272,17 +352,7 @@ class VisualizationProvider(OperationProvider):
 
         x_values = [x_min + i * x_step for i in range(points)]
         y_values = [y_min + i * y_step for i in range(points)]
-        z_values = []
-
-        for y in y_values:
-            z_row = []
-            for x in x_values:
-                try:
-                    z = self._evaluate_function_2d(func, x, y, session)
-                    z_row.append(z)
-                except Exception:
-                    z_row.append(float('nan'))
-            z_values.append(z_row)
+        z_values = self._sample_function_2d(func, x_values, y_values, session)
 
         return PlotData3D(x_values=x_values, y_values=y_values, z_values=z_values)
 
@@ -296,26 +366,21 @@ class VisualizationProvider(OperationProvider):
         if not values:
             raise ArgumentError("data cannot be empty")
 
-        return HistogramData(values=values, bins=bins, title=title)
+        # Pre-bin only when the bin arrays can't outgrow the data itself; an
+        # unbounded bin count is left for the renderer to bin (or never drawn)
+        edges, counts = _bin_uniform(values, bins) if bins <= len(values) else ([], [])
+        return HistogramData(values=values, bins=bins, title=title, edges=edges, counts=counts)
 
     def _scatter(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        x_values = self._extract_list(args[0], "x_values")
-        y_values = self._extract_list(args[1], "y_values")
+        x_values, y_values = self._extract_pair(args[0], args[1])
         title = self._get_string(args[2] if len(args) > 2 else None, "title")
 
-        if len(x_values) != len(y_values):
-            raise ArgumentError(f"x and y must have same length: {len(x_values)} vs {len(y_values)}")
-
         return ScatterData(x_values=x_values, y_values=y_values, title=title)
 
     def _line_plot(self, args: list["MathObject"], session: "Session") -> "MathObject":
-        x_values = self._extract_list(args[0], "x_values")
-        y_values = self._extract_list(args[1], "y_values")
+        x_values, y_values = self._extract_pair(args[0], args[1])
         title = self._get_string(args[2] if len(args) > 2 else None, "title")
 
-        if len(x_values) != len(y_values):
-            raise ArgumentError(f"x and y must have same length: {len(x_values)} vs {len(y_values)}")
-
         return PlotData2D(x_values=x_values, y_values=y_values, title=title)
 
     def _multi_plot(self, args: list["MathObject"], session: "Session") -> "MathObject":
@@ -339,14 +404,7 @@ class VisualizationProvider(OperationProvider):
             if not isinstance(func, Lambda):
                 raise TypeError(f"Each function must be a lambda, got {func.type_name}")
 
-            y_values = []
-            for x in x_values:
-                try:
-                    y = self._evaluate_function(func, x, session)
-                    y_values.append(y)
-                except Exception:
-                    y_values.append(float('nan'))
-
+            y_values = self._sample_function(func, x_values, session)
             plots.append(PlotData2D(x_values=x_values, y_values=y_values))
 
         return List(plots)
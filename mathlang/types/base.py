@@ -7,6 +7,8 @@ from typing import Any
 class MathObject(ABC):
     """Base class for all values in the MathLang type system."""
 
+    __slots__ = ()  # Lets subclasses that declare slots drop the per-instance __dict__
+
     @abstractmethod
     def __repr__(self) -> str:
         """Return a string representation for debugging."""
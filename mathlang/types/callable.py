@@ -1,6 +1,6 @@
 """Callable types: Lambda (anonymous functions) and Thunk (deferred expressions)."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from mathlang.types.base import MathObject
 from mathlang.lang.ast import expr_to_string
@@ -48,12 +48,12 @@ class Thunk(MathObject):
 class Lambda(MathObject):
     """An anonymous function (lambda expression)."""
 
-    def __init__(self, parameters: list[str], body: "Expression"):
-        self._parameters = parameters
+    def __init__(self, parameters: Sequence[str], body: "Expression"):
+        self._parameters = tuple(parameters)
         self._body = body
 
     @property
-    def parameters(self) -> list[str]:
+    def parameters(self) -> tuple[str, ...]:
         return self._parameters
 
     @property
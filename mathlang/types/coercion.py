@@ -5,6 +5,17 @@ from typing import Any
 from mathlang.types.scalar import Scalar
 
 
+# Kinds of the raw Scalar value types, keyed by exact type so one dict lookup
+# replaces an isinstance cascade. Numeric kinds are ordered by promotion rank.
+_BOOL, _INT, _FLOAT, _COMPLEX, _STR = range(5)
+_KIND: dict[type, int] = {bool: _BOOL, int: _INT, float: _FLOAT, complex: _COMPLEX, str: _STR}
+_NUMERIC_KINDS = frozenset({_INT, _FLOAT, _COMPLEX})
+
+# False, 0, 0.0, -0.0 and 0j all compare and hash equal to 0, so one membership
+# test catches every falsy value of the kinds above
+_FALSY = frozenset({0, ""})
+
+
 def coerce_numeric(a: Any, b: Any) -> tuple[Any, Any]:
     """
     Coerce two numeric values to a common type for operations.
@@ -15,15 +26,26 @@ def coerce_numeric(a: Any, b: Any) -> tuple[Any, Any]:
     val_a = a.value if isinstance(a, Scalar) else a
     val_b = b.value if isinstance(b, Scalar) else b
 
-    # If either is complex, promote both to complex
-    if isinstance(val_a, complex) or isinstance(val_b, complex):
+    kind = _KIND.get(type(val_a), _STR)
+    kind_b = _KIND.get(type(val_b), _STR)
+    if kind_b > kind:
+        kind = kind_b
+    if kind <= _INT:
+        # Both are int or bool; nothing to promote
+        return val_a, val_b
+    if kind == _FLOAT:
+        return float(val_a), float(val_b)
+    if kind == _COMPLEX:
         return complex(val_a), complex(val_b)
+    return _coerce_other(val_a, val_b)
 
-    # If either is float, promote both to float
+
+def _coerce_other(val_a: Any, val_b: Any) -> tuple[Any, Any]:
+    # Strings, dates and numeric subclasses take the general isinstance rules
+    if isinstance(val_a, complex) or isinstance(val_b, complex):
+        return complex(val_a), complex(val_b)
     if isinstance(val_a, float) or isinstance(val_b, float):
         return float(val_a), float(val_b)
-
-    # Both are int (or bool, which is subclass of int)
     return val_a, val_b
 
 
@@ -31,6 +53,9 @@ def is_numeric(value: Any) -> bool:
     """Check if a value is numeric (int, float, complex, or Scalar containing those)."""
     if isinstance(value, Scalar):
         value = value.value
+    kind = _KIND.get(type(value))
+    if kind is not None:
+        return kind in _NUMERIC_KINDS
     return isinstance(value, (int, float, complex)) and not isinstance(value, bool)
 
 
@@ -38,6 +63,8 @@ def is_truthy(value: Any) -> bool:
     """Determine the truthiness of a MathLang value."""
     if isinstance(value, Scalar):
         val = value.value
+        if type(val) in _KIND:
+            return val not in _FALSY
         if isinstance(val, bool):
             return val
         if isinstance(val, (int, float)):
@@ -52,6 +52,13 @@ class Interval(MathObject):
         self._start = start
         self._end = end
         self._step = step
+        self._values: tuple | None = None  # Filled by to_list() on first use
+
+    def _range(self) -> range | None:
+        """Return the equivalent range for an all-integer interval, else None."""
+        if isinstance(self._start, int) and isinstance(self._end, int) and isinstance(self._step, int):
+            return range(self._start, self._end, self._step)
+        return None
 
     @property
     def start(self) -> float:
@@ -67,6 +74,10 @@ class Interval(MathObject):
 
     def __len__(self) -> int:
         """Return the number of elements in the interval."""
+        int_range = self._range()
+        if int_range is not None:
+            # Exact; the float division below loses precision for big ints
+            return len(int_range)
         if self._step > 0:
             if self._start >= self._end:
                 return 0
@@ -78,37 +89,40 @@ class Interval(MathObject):
 
     def __iter__(self) -> Iterator[MathObject]:
         """Yield Scalar values lazily."""
+        int_range = self._range()
+        # Integer intervals step in C via range; others accumulate in _raw_values
+        return map(self._Scalar, int_range if int_range is not None else self._raw_values())
+
+    def _raw_values(self) -> Iterator[float]:
         current = self._start
         if self._step > 0:
             while current < self._end:
-                yield self._Scalar(current)
+                yield current
                 current += self._step
         else:
             while current > self._end:
-                yield self._Scalar(current)
+                yield current
                 current += self._step
 
     def __getitem__(self, index: int) -> MathObject:
         """Get element at index."""
+        length = len(self)
         if index < 0:
-            index = len(self) + index
-        if index < 0 or index >= len(self):
+            index += length
+        if index < 0 or index >= length:
             raise IndexError(f"Interval index {index} out of range")
         return self._Scalar(self._start + index * self._step)
 
     def to_list(self) -> list[float]:
-        """Generate all values in the interval as raw floats."""
-        result = []
-        current = self._start
-        if self._step > 0:
-            while current < self._end:
-                result.append(current)
-                current += self._step
-        else:
-            while current > self._end:
-                result.append(current)
-                current += self._step
-        return result
+        """Generate all values in the interval as raw numbers.
+
+        The values are computed once and cached; each call returns a fresh list so
+        callers may modify it freely.
+        """
+        if self._values is None:
+            int_range = self._range()
+            self._values = tuple(int_range if int_range is not None else self._raw_values())
+        return list(self._values)
 
     @property
     def type_name(self) -> str:
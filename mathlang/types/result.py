@@ -1,6 +1,6 @@
 """Result types: PlotData, Error, Notification."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from mathlang.types.base import MathObject
 
@@ -82,6 +82,9 @@ class HistogramData(MathObject):
     title: str = ""
     x_label: str = "Value"
     y_label: str = "Frequency"
+    # Pre-computed uniform binning (bins + 1 edges, bins counts); empty if not binned
+    edges: list[float] = field(default_factory=list)
+    counts: list[int] = field(default_factory=list)
 
     @property
     def type_name(self) -> str:
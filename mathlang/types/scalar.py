@@ -7,19 +7,50 @@ from mathlang.types.base import MathObject
 
 ScalarValue = Union[int, float, complex, bool, str, datetime]
 
+# Keyed by exact type, so bool never falls through to "Integer"
+_TYPE_NAMES: dict[type, str] = {
+    bool: "Boolean",
+    int: "Integer",
+    float: "Float",
+    complex: "Complex",
+    str: "String",
+    datetime: "DateTime",
+}
+
 
 class Scalar(MathObject):
     """A single value of any fundamental type."""
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: ScalarValue):
         self._value = value
 
+    @classmethod
+    def of(cls, value: ScalarValue) -> "Scalar":
+        """Return a Scalar for value, reusing a shared instance for small ints and booleans.
+
+        Scalars are never mutated, so ops that mostly produce small integers
+        (date components, counts, 0/1 flags) can share them instead of allocating.
+        """
+        if cls is Scalar:
+            kind = type(value)
+            if kind is int and _SMALL_INT_MIN <= value <= _SMALL_INT_MAX:
+                return _SMALL_INTS[value - _SMALL_INT_MIN]
+            if kind is bool:
+                return _BOOLS[value]
+        return cls(value)
+
     @property
     def value(self) -> ScalarValue:
         return self._value
 
     @property
     def type_name(self) -> str:
+        name = _TYPE_NAMES.get(type(self._value))
+        if name is not None:
+            return name
+        # Subclasses of the value types
         if isinstance(self._value, bool):
             return "Boolean"
         elif isinstance(self._value, int):
@@ -79,3 +110,9 @@ class Scalar(MathObject):
 
     def __hash__(self) -> int:
         return hash(self._value)
+
+
+_SMALL_INT_MIN = -5
+_SMALL_INT_MAX = 400  # Covers day-of-year as well as the usual small counts
+_SMALL_INTS = tuple(Scalar(i) for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX + 1))
+_BOOLS = (Scalar(False), Scalar(True))  # Indexed by the bool itself
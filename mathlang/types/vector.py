@@ -9,6 +9,8 @@ from mathlang.types.scalar import Scalar, ScalarValue
 class Vector(MathObject):
     """A homogeneous array of scalar values."""
 
+    __slots__ = ("_values",)
+
     def __init__(self, values: Sequence[ScalarValue]):
         self._values = list(values)
 
@@ -2,7 +2,7 @@
 
 import math
 import cmath
-from typing import Union
+from typing import Any, Callable, Union
 
 Numeric = Union[int, float, complex]
 
@@ -13,6 +13,11 @@ def safe_power(base: Numeric, exp: Numeric) -> Numeric:
 
     For negative bases with fractional exponents, returns complex.
     """
+    # Integer exponents never need the complex branch (and skip float(exp), which
+    # overflows for huge ints)
+    if isinstance(exp, int) and not isinstance(base, complex):
+        return base ** exp
+
     if isinstance(base, complex) or isinstance(exp, complex):
         return cmath.exp(exp * cmath.log(base))
 
@@ -30,10 +35,47 @@ def is_close(a: Numeric, b: Numeric, rel_tol: float = 1e-9, abs_tol: float = 0.0
     Works for int, float, and complex.
     """
     if isinstance(a, complex) or isinstance(b, complex):
-        return abs(complex(a) - complex(b)) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
+        return cmath.isclose(a, b, rel_tol=rel_tol, abs_tol=abs_tol)
     return math.isclose(a, b, rel_tol=rel_tol, abs_tol=abs_tol)
 
 
+def _format_complex(n: complex, precision: int) -> str:
+    real_str = format_number(n.real, precision)
+    imag = n.imag
+    if imag == 0:
+        return real_str
+    imag_str = format_number(abs(imag), precision)
+    if n.real == 0:
+        return f"{'-' if imag < 0 else ''}{imag_str}i"
+    sign = " + " if imag >= 0 else " - "
+    return f"{real_str}{sign}{imag_str}i"
+
+
+def _format_float(n: float, precision: int) -> str:
+    if n.is_integer():
+        return str(int(n))
+    # Round to precision and strip trailing zeros
+    formatted = f"{n:.{precision}g}"
+    return formatted
+
+
+def _format_other(n: Numeric, precision: int) -> str:
+    # Subclasses (bool, numpy scalars) miss the exact-type table; classify by isinstance
+    if isinstance(n, complex):
+        return _format_complex(n, precision)
+    if isinstance(n, float):
+        return _format_float(n, precision)
+    return str(n)
+
+
+# Formatters keyed by exact type: one dict lookup instead of an isinstance chain
+_NUMBER_FORMATTERS: dict[type, Callable[[Any, int], str]] = {
+    int: lambda n, precision: str(n),
+    float: _format_float,
+    complex: _format_complex,
+}
+
+
 def format_number(n: Numeric, precision: int = 10) -> str:
     """
     Format a number for display.
@@ -42,22 +84,4 @@ def format_number(n: Numeric, precision: int = 10) -> str:
     - Floats rounded to precision
     - Complex formatted as a + bi
     """
-    if isinstance(n, complex):
-        real_str = format_number(n.real, precision)
-        imag = n.imag
-        if imag == 0:
-            return real_str
-        imag_str = format_number(abs(imag), precision)
-        if n.real == 0:
-            return f"{'-' if imag < 0 else ''}{imag_str}i"
-        sign = " + " if imag >= 0 else " - "
-        return f"{real_str}{sign}{imag_str}i"
-
-    if isinstance(n, float):
-        if n.is_integer():
-            return str(int(n))
-        # Round to precision and strip trailing zeros
-        formatted = f"{n:.{precision}g}"
-        return formatted
-
-    return str(n)
+    return _NUMBER_FORMATTERS.get(type(n), _format_other)(n, precision)
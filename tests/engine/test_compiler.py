@@ -0,0 +1,42 @@
+"""Tests for the lambda compiler."""
+
+import pytest
+
+from mathlang.engine import evaluate
+from mathlang.engine.compiler import compile_lambda
+
+
+def _lambda(source, session):
+    return evaluate(source, session)[-1].value
+
+
+class TestCompileLambda:
+    """Test compiling lambda bodies to raw-value closures."""
+
+    def test_arithmetic_matches_interpreter(self, session):
+        lam = _lambda("x -> 2 * x ^ 2 - x / 4 + 1", session)
+        compiled = compile_lambda(lam, session)
+        for x in (-2.0, 0.5, 3.0):
+            expected = evaluate(f"f = {lam.display()}; f({x})", session)[-1].value.value
+            assert compiled(x) == expected
+
+    def test_operation_calls_and_constants(self, session):
+        lam = _lambda("x -> Sin(x) + [[PI]]", session)
+        compiled = compile_lambda(lam, session)
+        assert compiled(0.0) == pytest.approx(3.141592653589793)
+
+    def test_free_variables_resolved_from_session(self, session):
+        lam = _lambda("k = 3; x -> k * x", session)
+        assert compile_lambda(lam, session)(2.0) == 6.0
+
+    def test_multiple_parameters(self, session):
+        lam = _lambda("(x, y) -> x - y", session)
+        assert compile_lambda(lam, session)(5.0, 2.0) == 3.0
+
+    def test_user_lambda_calls_not_compiled(self, session):
+        lam = _lambda("g = x -> x + 1; x -> g(x)", session)
+        assert compile_lambda(lam, session) is None
+
+    def test_unbound_identifier_not_compiled(self, session):
+        lam = _lambda("x -> x + missing", session)
+        assert compile_lambda(lam, session) is None
@@ -45,6 +45,11 @@ class TestParseError:
     def test_inherits_from_mathlang_error(self):
         assert issubclass(ParseError, MathLangError)
 
+    def test_message_formatted_once(self):
+        error = ParseError("unexpected token", line=5, column=10)
+        assert error.args == ("Parse error at line 5, column 10: unexpected token",)
+        assert str(error) == error.args[0]
+
 
 class TestSyntaxError:
     """Tests for SyntaxError."""
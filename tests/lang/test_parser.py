@@ -124,19 +124,19 @@ class TestLambda:
         result = parse("x -> x + 1")
         expr = result.statements[0].expression
         assert isinstance(expr, ast.LambdaExpr)
-        assert expr.parameters == ["x"]
+        assert expr.parameters == ("x",)
 
     def test_multi_param_lambda(self):
         result = parse("(x, y) -> x + y")
         expr = result.statements[0].expression
         assert isinstance(expr, ast.LambdaExpr)
-        assert expr.parameters == ["x", "y"]
+        assert expr.parameters == ("x", "y")
 
     def test_no_param_lambda(self):
         result = parse("() -> 42")
         expr = result.statements[0].expression
         assert isinstance(expr, ast.LambdaExpr)
-        assert expr.parameters == []
+        assert expr.parameters == ()
 
 
 class TestNamedConstants:
@@ -170,7 +170,7 @@ class TestFunctionDefinitions:
         assert isinstance(stmt, ast.Assignment)
         assert stmt.name == "square"
         assert isinstance(stmt.value, ast.LambdaExpr)
-        assert stmt.value.parameters == ["x"]
+        assert stmt.value.parameters == ("x",)
 
     def test_multi_param_func_def(self):
         result = parse("add(a, b) = a + b")
@@ -178,7 +178,7 @@ class TestFunctionDefinitions:
         assert isinstance(stmt, ast.Assignment)
         assert stmt.name == "add"
         assert isinstance(stmt.value, ast.LambdaExpr)
-        assert stmt.value.parameters == ["a", "b"]
+        assert stmt.value.parameters == ("a", "b")
 
     def test_no_param_func_def(self):
         result = parse("getPI() = [[PI]]")
@@ -186,7 +186,12 @@ class TestFunctionDefinitions:
         assert isinstance(stmt, ast.Assignment)
         assert stmt.name == "getPI"
         assert isinstance(stmt.value, ast.LambdaExpr)
-        assert stmt.value.parameters == []
+        assert stmt.value.parameters == ()
+
+    def test_func_def_rejects_non_identifier_params(self):
+        from mathlang.lang.errors import SyntaxError
+        with pytest.raises(SyntaxError):
+            parse("f(1) = 2")
 
 
 class TestArrayIndex:
@@ -227,6 +232,14 @@ class TestComplexNumbers:
         assert isinstance(expr, ast.NumberLiteral)
         assert expr.value == 3 - 2j
 
+    def test_complex_respects_precedence(self):
+        result = parse("2 * 3 + 2i")
+        expr = result.statements[0].expression
+        assert isinstance(expr, ast.BinaryOp)
+        assert expr.operator == "+"
+        assert isinstance(expr.left, ast.BinaryOp)
+        assert expr.right.value == 2j
+
 
 class TestScientificNotation:
     """Test scientific notation parsing."""
@@ -257,3 +270,23 @@ class TestComments:
     def test_comment_line_ignored(self):
         result = parse("# full line comment\nx = 1")
         assert len(result.statements) == 1
+
+
+class TestParseCache:
+    """Test that parse results are reused for identical source."""
+
+    def test_same_source_returns_cached_program(self):
+        assert parse("a = 1 + 2") is parse("a = 1 + 2")
+
+    def test_nodes_are_immutable(self):
+        import dataclasses
+        expr = parse("1 + 2").statements[0].expression
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            expr.operator = "-"
+
+    def test_child_sequences_are_immutable(self):
+        program = parse("f = (x, y) -> Max(x, y)")
+        lam = program.statements[0].value
+        assert isinstance(program.statements, tuple)
+        assert isinstance(lam.parameters, tuple)
+        assert isinstance(lam.body.arguments, tuple)
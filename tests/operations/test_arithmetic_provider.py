@@ -53,6 +53,19 @@ def test_log_variants_and_errors(provider: ArithmeticProvider):
         provider._log10([Scalar("bad")], None)
 
 
+def test_signed_zeros_are_not_shared_through_cache(provider: ArithmeticProvider):
+    above = provider._log([Scalar(complex(-4, 0.0))], None).value
+    below = provider._log([Scalar(complex(-4, -0.0))], None).value
+    assert above.imag == pytest.approx(math.pi)
+    assert below.imag == pytest.approx(-math.pi)
+
+    assert provider._sqrt([Scalar(complex(-4, 0.0))], None).value.imag == 2
+    assert provider._sqrt([Scalar(complex(-4, -0.0))], None).value.imag == -2
+
+    assert math.copysign(1, provider._sqrt([Scalar(-0.0)], None).value) == -1
+    assert math.copysign(1, provider._sqrt([Scalar(0.0)], None).value) == 1
+
+
 def test_round_with_invalid_decimals(provider: ArithmeticProvider):
     result = provider._round([Scalar(1.2345), Scalar(2)], None)
     assert math.isclose(result.value, 1.23, rel_tol=0, abs_tol=1e-9)
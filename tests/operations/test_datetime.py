@@ -45,6 +45,14 @@ class TestCurrentDateTime:
         results = evaluate("UtcNow()", session)
         assert isinstance(results[0].value, DateTime)
 
+    def test_now_is_stable_within_one_evaluation(self, session):
+        results = evaluate("a = Now(); b = Now(); a == b", session)
+        assert results[2].value.value
+
+    def test_now_fresh_returns_datetime(self, session):
+        results = evaluate("NowFresh()", session)
+        assert isinstance(results[0].value, DateTime)
+
 
 class TestDateTimeCreation:
     """Tests for DateOf and DateTimeOf."""
@@ -1,5 +1,7 @@
 """Additional coverage for StatisticsProvider operations."""
 
+import math
+
 import pytest
 
 from mathlang.engine.errors import ArgumentError, TypeError
@@ -67,6 +69,33 @@ def test_relationship_metrics(provider: StatisticsProvider):
         provider._linear_regression([identical, identical], None)
 
 
+def test_constant_inexact_values_have_zero_spread(provider: StatisticsProvider):
+    # sum([0.1] * 3) / 3 != 0.1, so these must not go through the rounded mean
+    tenths = List([Scalar(0.1)] * 3)
+    assert provider._variance([tenths], None).value == 0.0
+
+    with pytest.raises(ArgumentError, match="identical"):
+        provider._linear_regression([tenths, List([Scalar(1), Scalar(2), Scalar(3)])], None)
+
+    xs = List([Scalar(1), Scalar(2), Scalar(3)])
+    slope, intercept, r_squared = provider._linear_regression([xs, tenths], None).items
+    assert slope.value == 0.0
+    assert intercept.value == 0.1
+    assert r_squared.value == 1.0
+
+
+def test_nan_after_first_value_is_not_constant(provider: StatisticsProvider):
+    nan = float("nan")
+    assert math.isnan(provider._variance([List([Scalar(1), Scalar(nan)])], None).value)
+    assert math.isnan(provider._stddev([List([Scalar(2), Scalar(nan), Scalar(2)])], None).value)
+
+    xs = List([Scalar(1), Scalar(2), Scalar(3)])
+    ys = List([Scalar(4), Scalar(nan), Scalar(4)])
+    assert math.isnan(provider._covariance([xs, ys], None).value)
+    slope = provider._linear_regression([xs, ys], None).items[0]
+    assert math.isnan(slope.value)
+
+
 def test_percentiles_and_quartiles(provider: StatisticsProvider):
     values = List([Scalar(1), Scalar(2), Scalar(3), Scalar(4)])
 
@@ -18,6 +18,11 @@ class TestPlot:
         assert len(result.y_values) == 10
         assert result.y_values[0] == pytest.approx(1.0)
 
+    def test_plot_draws_random_constant_per_point(self, session):
+        result = evaluate("Plot(x -> x + [[Random]], 0, 1, 5)", session)[0].value
+        offsets = {y - x for x, y in zip(result.x_values, result.y_values)}
+        assert len(offsets) > 1
+
     def test_plot_with_lists(self, session):
         results = evaluate("Plot(List(1, 2, 3), List(1, 4, 9))", session)
         result = results[0].value
@@ -129,6 +134,28 @@ class TestHistogram:
         result = results[0].value
         assert result.bins == 5
 
+    def test_histogram_precomputes_bins(self, session):
+        results = evaluate("Histogram(List(1, 2, 2, 3, 3, 3), 2)", session)
+        result = results[0].value
+        assert result.edges == [1.0, 2.0, 3.0]
+        assert result.counts == [1, 5]
+
+    def test_histogram_with_more_bins_than_values_skips_prebinning(self, session):
+        result = evaluate("Histogram(List(1, 2), 20000000)", session)[0].value
+        assert result.bins == 20000000
+        assert result.edges == []
+        assert result.counts == []
+
+    def test_histogram_with_nan_leaves_binning_to_renderer(self, session):
+        result = evaluate("Histogram(List(1, [[NAN]], 3), 2)", session)[0].value
+        assert len(result.values) == 3
+        assert result.counts == []
+
+    def test_histogram_with_overflowing_span_leaves_binning_to_renderer(self, session):
+        result = evaluate("Histogram(List(-1e308, 1e308, 0), 2)", session)[0].value
+        assert result.edges == []
+        assert result.counts == []
+
     def test_histogram_with_title(self, session):
         results = evaluate('Histogram(List(1, 2, 3), 10, "My Histogram")', session)
         result = results[0].value
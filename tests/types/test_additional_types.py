@@ -115,3 +115,21 @@ def test_scalar_display_and_types():
     assert (Scalar(2) * Scalar(3)).value == 6
     assert (Scalar(8) / Scalar(2)).value == 4
     assert (Scalar(2) ** Scalar(3)).value == 8
+
+
+def test_scalar_of_shares_small_ints():
+    assert Scalar.of(7) is Scalar.of(7)
+    assert Scalar.of(7) == Scalar(7)
+    assert Scalar.of(True).type_name == "Boolean"
+    assert Scalar.of(True) is Scalar.of(True)
+    assert Scalar.of(False).value is False
+    assert Scalar.of(10_000) is not Scalar.of(10_000)
+    assert Scalar.of(2.5).value == 2.5
+
+
+def test_interval_to_list_is_cached_copy():
+    interval = Interval(0, 4)
+    values = interval.to_list()
+    values.append(99)
+    assert interval.to_list() == [0, 1, 2, 3]
+    assert [v.value for v in Interval(0.0, 1.0, 0.25)] == [0.0, 0.25, 0.5, 0.75]
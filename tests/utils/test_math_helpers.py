@@ -66,6 +66,10 @@ class TestIsClose:
     def test_not_close_complex(self):
         assert not is_close(1+1j, 1+2j)
 
+    def test_complex_infinity_equals_itself(self):
+        inf = float("inf")
+        assert is_close(complex(inf, 1), complex(inf, 1))
+
     def test_mixed_types(self):
         assert is_close(1, 1.0)
 